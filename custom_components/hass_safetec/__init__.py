@@ -9,6 +9,7 @@ from .services import register_services
 from .device import register_device
 from .migrate import migrate_entry
 from .coordinator import PontosDataUpdateCoordinator
+from .utils import create_session
 from .const import DOMAIN, CONF_MAKE, MAKES
 
 LOGGER = logging.getLogger(__name__)
@@ -19,8 +20,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     make = entry.data.get(CONF_MAKE)
     device_const = MAKES[make]
 
+    # Home Assistant managed session for this entry; HA closes it at shutdown
+    session = create_session(hass)
+    entry.async_on_unload(session.close)
+
     # Set up the coordinator for data fetching
-    coordinator = PontosDataUpdateCoordinator(hass, entry, device_const)
+    coordinator = PontosDataUpdateCoordinator(hass, entry, device_const, session)
     await coordinator.async_config_entry_first_refresh()
 
     # Store entries in hass.data
@@ -28,6 +33,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     hass.data[DOMAIN].setdefault("entries", {})[entry.entry_id] = {
         "entry": entry,
         "coordinator": coordinator,
+        "session": session,
         "device_info": None,
         "command_lock": asyncio.Lock(),
     }
@@ -37,6 +43,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         await register_device(hass, entry, coordinator)
     except Exception as e:
         LOGGER.error(f"Error setting up device: {e}")
+        hass.data[DOMAIN]["entries"].pop(entry.entry_id, None)
         raise ConfigEntryNotReady from e
 
     # Register services
@@ -73,8 +80,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Handle config entry reload (triggered by options flow changes)."""
-    await async_unload_entry(hass, entry)
-    return await async_setup_entry(hass, entry)
+    await hass.config_entries.async_reload(entry.entry_id)
 
 
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
@@ -31,7 +31,7 @@ class PontosServiceButton(ButtonEntity):
     def __init__(self, hass, entry, device_info, key, config):
         self._hass = hass
         self._entry = entry
-        self._device_info = device_info
+        self._attr_device_info = {"identifiers": device_info["identifiers"]}
         self._key = key
         self._config = config
         self._attr_translation_key = key
@@ -96,16 +96,6 @@ class PontosServiceButton(ButtonEntity):
             service_data={"entry_id": self._entry.entry_id},
         )
 
-    @property
-    def unique_id(self):
-        return self._attr_unique_id
-
-    @property
-    def device_info(self):
-        return {
-            "identifiers": self._device_info["identifiers"],
-        }
-
     @property
     def available(self):
         return self._available
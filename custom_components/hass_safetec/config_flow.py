@@ -14,6 +14,33 @@ from .const import (
     DEFAULT_PORT,
 )
 
+STEP_USER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(
+            CONF_IP_ADDRESS, description={"suggested_value": "192.168.1.100"}
+        ): str,
+        vol.Required(CONF_FETCH_INTERVAL, default=10): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Required(CONF_PORT, default=DEFAULT_PORT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=65535)
+        ),
+        vol.Required(CONF_DEVICE_NAME, default="Pontos"): str,
+        vol.Required(CONF_MAKE, default="SYR SafeTech+"): vol.In(list(MAKES.keys())),
+    }
+)
+
+
+async def async_test_connection(hass, ip_address: str, port: int, make: str) -> bool:
+    """Test a connection to the selected device's URLs."""
+    device_const = MAKES.get(make)
+    if not device_const:
+        return False
+
+    url_list = device_const.URL_LIST  # Each make-specific file defines URL_LIST
+    data = await fetch_data(hass, ip_address, url_list, port=port)
+    return bool(data)
+
 
 class PontosConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 4
@@ -29,7 +56,9 @@ class PontosConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             make = user_input[CONF_MAKE]
 
             # Validate the IP by attempting a connection
-            valid = await self._test_connection(ip, user_input[CONF_PORT], make)
+            valid = await async_test_connection(
+                self.hass, ip, user_input[CONF_PORT], make
+            )
             if valid:
                 data = {
                     CONF_DEVICE_NAME: user_input[CONF_DEVICE_NAME],
@@ -51,40 +80,12 @@ class PontosConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "cannot_connect"
 
         # Show the form (including the dropdown for make)
-        data_schema = vol.Schema(
-            {
-                vol.Required(
-                    CONF_IP_ADDRESS, description={"suggested_value": "192.168.1.100"}
-                ): str,
-                vol.Required(CONF_FETCH_INTERVAL, default=10): vol.All(
-                    vol.Coerce(int), vol.Range(min=1)
-                ),
-                vol.Required(CONF_PORT, default=DEFAULT_PORT): vol.All(
-                    vol.Coerce(int), vol.Range(min=1, max=65535)
-                ),
-                vol.Required(CONF_DEVICE_NAME, default="Pontos"): str,
-                vol.Required(CONF_MAKE, default="SYR SafeTech+"): vol.In(
-                    list(MAKES.keys())
-                ),
-            }
-        )
-
         return self.async_show_form(
             step_id="user",
-            data_schema=data_schema,
+            data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
 
-    async def _test_connection(self, ip_address: str, port: int, make: str) -> bool:
-        """Test a connection to the selected device's URLs."""
-        device_const = MAKES.get(make)
-        if not device_const:
-            return False
-
-        url_list = device_const.URL_LIST  # Each make-specific file defines URL_LIST
-        data = await fetch_data(self.hass, ip_address, url_list, port=port)
-        return bool(data)
-
     @staticmethod
     @callback
     def async_get_options_flow(config_entry):
@@ -114,7 +115,9 @@ class PontosOptionsFlowHandler(config_entries.OptionsFlow):
             )
             make = config_entry.data[CONF_MAKE]
 
-            if await self._test_connection(new_ip, user_input[CONF_PORT], make):
+            if await async_test_connection(
+                self.hass, new_ip, user_input[CONF_PORT], make
+            ):
                 # If valid, create (or update) the options
                 return self.async_create_entry(
                     title="",
@@ -144,16 +147,6 @@ class PontosOptionsFlowHandler(config_entries.OptionsFlow):
             errors=errors,
         )
 
-    async def _test_connection(self, ip_address: str, port: int, make: str) -> bool:
-        """Test if we can successfully reach the device with the new IP."""
-        device_const = MAKES.get(make)
-        if not device_const:
-            return False
-
-        url_list = device_const.URL_LIST
-        data = await fetch_data(self.hass, ip_address, url_list, port=port)
-        return bool(data)
-
     @staticmethod
     @callback
     def async_get_options_flow(config_entry):
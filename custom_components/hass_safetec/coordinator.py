@@ -2,21 +2,41 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, Upda
 from datetime import timedelta
 import logging
 import asyncio
+import time
 
-from .utils import fetch_data
+from .utils import REQUEST_TIMEOUT, fetch_data, is_set_url
 from .const import CONF_DEVICE_NAME, CONF_IP_ADDRESS, CONF_FETCH_INTERVAL, CONF_PORT, DEFAULT_PORT
 
 _LOGGER = logging.getLogger(__name__)
 
+# Re-send admin mode at least this often, even if reads still succeed
+ADMIN_REFRESH_POLLS = 8
+
+# Stop polling an unreachable device for a while after this many failed polls
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_COOLDOWN = 60
+
+# Share of the fetch interval a poll, including retries, may take, capped in seconds
+POLL_BUDGET = 0.8
+MAX_POLL_DURATION = 30
+
+MAX_ATTEMPTS = 4
+
 
 class PontosDataUpdateCoordinator(DataUpdateCoordinator):
-    def __init__(self, hass, entry, device_const):
+    def __init__(self, hass, entry, device_const, session=None):
         self.hass = hass
         self.entry = entry
+        self.session = session
         self.device_name = entry.data[CONF_DEVICE_NAME]
         self.ip_address = entry.options[CONF_IP_ADDRESS]
         self.port = entry.options.get(CONF_PORT, DEFAULT_PORT)
         self.url_list = device_const.URL_LIST
+        self.read_url_list = [url for url in self.url_list if not is_set_url(url)]
+        self.has_admin_url = len(self.read_url_list) < len(self.url_list)
+        self._polls_since_admin = None
+        self._consecutive_failures = 0
+        self._breaker_open_until = 0.0
         self._lock = asyncio.Lock()
 
         super().__init__(
@@ -29,14 +49,15 @@ class PontosDataUpdateCoordinator(DataUpdateCoordinator):
     async def _async_update_data(self):
         async with self._lock:
             self._update_options()
+            if time.monotonic() < self._breaker_open_until:
+                raise UpdateFailed(
+                    f"Device at {self.ip_address} is unreachable, skipping poll"
+                )
+
             try:
-                data = await fetch_data(
-                    self.hass,
-                    self.ip_address,
-                    self.url_list,
-                    port=self.port,
-                    max_attempts=4,
-                    retry_delay=int(self.update_interval.total_seconds()),
+                send_admin = self._admin_due()
+                data = await self._fetch(
+                    self.url_list if send_admin else self.read_url_list
                 )
                 if not data:
                     self.async_set_updated_data(None)
@@ -44,12 +65,66 @@ class PontosDataUpdateCoordinator(DataUpdateCoordinator):
                         f"No data received from device at {self.ip_address}"
                     )
 
+                if send_admin:
+                    self._polls_since_admin = 0
+                elif self.has_admin_url and self._admin_lapsed(data):
+                    # The reads were served outside admin mode; send it with the next poll
+                    self._polls_since_admin = None
+                elif self._polls_since_admin is not None:
+                    self._polls_since_admin += 1
+                self._consecutive_failures = 0
                 return data
 
             except Exception as err:
+                self._polls_since_admin = None
+                self._record_failure()
                 self.async_set_updated_data(None)
                 raise UpdateFailed(f"Error fetching data: {err}")
 
+    def _record_failure(self):
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= BREAKER_FAILURE_THRESHOLD:
+            # After the cooldown one poll is let through; another failure reopens it
+            _LOGGER.warning(
+                f"{self._consecutive_failures} consecutive failed polls of {self.ip_address}, "
+                f"pausing requests for {BREAKER_COOLDOWN} seconds"
+            )
+            self._breaker_open_until = time.monotonic() + BREAKER_COOLDOWN
+
+    async def _fetch(self, url_list):
+        # All requests and retries of this poll share one bounded time budget
+        budget = max(
+            REQUEST_TIMEOUT.total,
+            min(MAX_POLL_DURATION, POLL_BUDGET * self.update_interval.total_seconds()),
+        )
+        deadline = asyncio.get_running_loop().time() + budget
+        return await fetch_data(
+            self.hass,
+            self.ip_address,
+            url_list,
+            port=self.port,
+            max_attempts=MAX_ATTEMPTS,
+            # Backoff caps double per retry, so all retries fit in under half the budget
+            retry_delay=budget / 2 ** MAX_ATTEMPTS,
+            session=self.session,
+            deadline=deadline,
+        )
+
+    def _admin_due(self):
+        """Admin mode is sent on the first poll, after failures, and periodically."""
+        if not self.has_admin_url:
+            return False
+        return (
+            self._polls_since_admin is None
+            or self._polls_since_admin >= ADMIN_REFRESH_POLLS
+        )
+
+    def _admin_lapsed(self, data):
+        return any(
+            isinstance(value, str) and "ERROR: ADM" in value.upper()
+            for value in data.values()
+        )
+
     def _update_options(self):
         self.ip_address = self.entry.options[CONF_IP_ADDRESS]
         self.port = self.entry.options.get(CONF_PORT, DEFAULT_PORT)
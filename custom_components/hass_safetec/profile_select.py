@@ -2,7 +2,7 @@ import logging
 from homeassistant.components.select import SelectEntity
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.event import async_call_later, async_track_state_change_event
-from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import callback, Event
 from homeassistant.util import slugify
 
@@ -10,14 +10,8 @@ from .const import DOMAIN, CONF_IP_ADDRESS
 
 LOGGER = logging.getLogger(__name__)
 
-
-async def async_setup_entry(hass, entry, async_add_entities):
-    """Set up the custom profile select entity."""
-    device_info = hass.data[DOMAIN]["entries"][entry.entry_id]["device_info"]
-
-    # Instantiate the select entity
-    select_entity = PontosProfileSelect(hass, entry, device_info)
-    async_add_entities([select_entity], True)
+# Name sensor states that do not hold a usable profile label
+INVALID_NAME_STATES = frozenset((STATE_UNKNOWN, STATE_UNAVAILABLE, "", None))
 
 
 class PontosProfileSelect(SelectEntity):
@@ -33,6 +27,7 @@ class PontosProfileSelect(SelectEntity):
         self._hass = hass
         self._entry = entry
         self._device_info = device_info
+        self._attr_device_info = {"identifiers": device_info["identifiers"]}
 
         # Construct entity metadata
         serial_number = device_info["serial_number"]
@@ -186,13 +181,7 @@ class PontosProfileSelect(SelectEntity):
         new_options = []
         for code, name_entity_id in self._profile_name_entity_ids.items():
             state_obj = self._hass.states.get(name_entity_id)
-            if state_obj and state_obj.state not in (
-                "unknown",
-                "unavailable",
-                STATE_UNAVAILABLE,
-                "",
-                None,
-            ):
+            if state_obj and state_obj.state not in INVALID_NAME_STATES:
                 label = state_obj.state.strip()
                 if label:
                     new_options.append(label)
@@ -254,22 +243,11 @@ class PontosProfileSelect(SelectEntity):
             return None
 
         state_obj = self._hass.states.get(name_entity_id)
-        if state_obj and state_obj.state not in (
-            "unknown",
-            "unavailable",
-            STATE_UNAVAILABLE,
-            "",
-            None,
-        ):
+        if state_obj and state_obj.state not in INVALID_NAME_STATES:
             return state_obj.state.strip()
 
         return None
 
-    @property
-    def device_info(self):
-        """Link this select entity to the device registry entry."""
-        return {"identifiers": self._device_info["identifiers"]}
-
     @property
     def available(self):
         """Entity is unavailable if the current option is STATE_UNAVAILABLE."""
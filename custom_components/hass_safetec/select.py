@@ -36,7 +36,7 @@ class PontosDropdownSelect(SelectEntity):
     def __init__(self, hass, entry, device_info, key, config):
         self._hass = hass
         self._entry = entry
-        self._device_info = device_info
+        self._attr_device_info = {"identifiers": device_info["identifiers"]}
         self._key = key
         self._config = config
         self._sensor = config["sensor"]
@@ -127,16 +127,6 @@ class PontosDropdownSelect(SelectEntity):
         self._attr_current_option = option
         self.async_write_ha_state()
 
-    @property
-    def unique_id(self):
-        return self._attr_unique_id
-
-    @property
-    def device_info(self):
-        return {
-            "identifiers": self._device_info["identifiers"],
-        }
-
     @property
     def available(self):
         return self._available
@@ -1,5 +1,6 @@
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.components.sensor import SensorEntity
+from homeassistant.core import callback
 from homeassistant.util import slugify
 import logging
 
@@ -40,31 +41,31 @@ class PontosSensor(CoordinatorEntity, SensorEntity):
         self._attr_unique_id = slugify(
             f"{device_info['serial_number']}_{sensor_config['name']}"
         )
-        self._device_info = device_info
+        self._attr_device_info = {"identifiers": device_info["identifiers"]}
+        self._update_from_data(coordinator.data or {})
 
-    @property
-    def unique_id(self):
-        return self._attr_unique_id
+    @callback
+    def _handle_coordinator_update(self):
+        """Parse the new coordinator data once, rather than on every state read."""
+        self._update_from_data(self.coordinator.data or {})
+        super()._handle_coordinator_update()
 
-    @property
-    def device_info(self):
-        return {
-            "identifiers": self._device_info["identifiers"],
-        }
+    def _update_from_data(self, data):
+        if not data:
+            # Failed poll: nothing to parse, the sensor is simply unavailable
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = None
+            return
 
-    @property
-    def native_value(self):
-        data = self.coordinator.data or {}
-        return self.parse_data(data)
+        self._attr_native_value = self.parse_data(data)
+        self._attr_extra_state_attributes = self.build_attributes(data)
 
     @property
     def available(self):
-        data = self.coordinator.data or {}
-        return self.parse_data(data) is not None
+        return self._attr_native_value is not None
 
-    @property
-    def extra_state_attributes(self):
-        data = self.coordinator.data or {}
+    def build_attributes(self, data):
+        """Collect the raw value and configured attributes from sensor data."""
         attributes = {}
 
         # Always add the raw value of the main sensor endpoint
@@ -73,26 +74,10 @@ class PontosSensor(CoordinatorEntity, SensorEntity):
             attributes["raw_value"] = raw_value
 
         # Add explicitly defined attributes
-        if self._attributes:
-            attributes.update(
-                {
-                    attr_name: data.get(endpoint)
-                    for attr_name, endpoint in self._attributes.items()
-                    if data.get(endpoint) is not None
-                }
-            )
-
-        serial_endpoint = self._device_info.get("serial_number")
-        if serial_endpoint:
-            serial_value = data.get(serial_endpoint)
-            if serial_value is not None:
-                attributes["serial_number"] = serial_value
-
-        firmware_endpoint = self._device_info.get("firmware_version")
-        if firmware_endpoint:
-            firmware_value = data.get(firmware_endpoint)
-            if firmware_value is not None:
-                attributes["firmware_version"] = firmware_value
+        for attr_name, endpoint in self._attributes.items():
+            value = data.get(endpoint)
+            if value is not None:
+                attributes[attr_name] = value
 
         return attributes if attributes else None
 
@@ -105,6 +90,12 @@ class PontosSensor(CoordinatorEntity, SensorEntity):
         if _data is None:
             return None
 
+        # Numeric values can skip the string handling unless a code lookup applies
+        if type(_data) in (int, float) and self._code_dict is None:
+            if self._scale is not None:
+                return round(_data * self._scale, 2)
+            return str(_data)
+
         # Convert to string for more consistent manipulation later
         _data = str(_data)
 
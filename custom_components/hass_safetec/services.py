@@ -6,7 +6,9 @@ from .const import DOMAIN, MAKES, CONF_MAKE, CONF_IP_ADDRESS
 LOGGER = logging.getLogger(__name__)
 
 
-async def async_send_command(hass, ip_address, base_url, endpoint, data=None):
+async def async_send_command(
+    hass, ip_address, base_url, endpoint, data=None, session=None
+):
     """Helper function to send commands to the device."""
     # Format the endpoint with dynamic data if provided
     if data:
@@ -16,7 +18,9 @@ async def async_send_command(hass, ip_address, base_url, endpoint, data=None):
     url = base_url.format(ip=ip_address) + endpoint
 
     # Use fetch_data for retries
-    result = await fetch_data(hass, ip_address, url, max_attempts=4, retry_delay=1)
+    result = await fetch_data(
+        hass, ip_address, url, max_attempts=4, retry_delay=1, session=session
+    )
 
     # Log the response
     if result:
@@ -54,7 +58,14 @@ async def async_service_handler(hass, call, service_name):
             endpoint = device_const.SERVICES[service_name]["endpoint"]
 
             # Send the command with dynamic data (if any)
-            await async_send_command(hass, ip_address, base_url, endpoint, call.data)
+            await async_send_command(
+                hass,
+                ip_address,
+                base_url,
+                endpoint,
+                call.data,
+                session=entry_data.get("session"),
+            )
 
             # Trigger a data refresh after the command
             await coordinator.async_refresh()
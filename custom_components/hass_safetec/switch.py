@@ -30,7 +30,7 @@ class PontosSwitch(SwitchEntity):
     def __init__(self, hass, entry, device_info, key, config):
         self._hass = hass
         self._entry = entry
-        self._device_info = device_info
+        self._attr_device_info = {"identifiers": device_info["identifiers"]}
         self._key = key
         self._config = config
         self._sensor = config["sensor"]
@@ -111,15 +111,3 @@ class PontosSwitch(SwitchEntity):
     def available(self):
         """Return if the switch is available."""
         return self._available
-
-    @property
-    def unique_id(self):
-        """Return the unique ID of the switch."""
-        return self._attr_unique_id
-
-    @property
-    def device_info(self):
-        """Return device info to link this entity with the device."""
-        return {
-            "identifiers": self._device_info["identifiers"],
-        }
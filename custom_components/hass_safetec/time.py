@@ -34,7 +34,7 @@ class PontosTimeEntry(TimeEntity):
     def __init__(self, hass, entry, device_info, key, config):
         self._hass = hass
         self._entry = entry
-        self._device_info = device_info
+        self._attr_device_info = {"identifiers": device_info["identifiers"]}
         self._key = key
         self._config = config
         self._sensor = config.get("sensor")
@@ -173,16 +173,6 @@ class PontosTimeEntry(TimeEntity):
         self._attr_native_value = native
         self.async_write_ha_state()
 
-    @property
-    def unique_id(self):
-        return self._attr_unique_id
-
-    @property
-    def device_info(self):
-        return {
-            "identifiers": self._device_info["identifiers"],
-        }
-
     @property
     def available(self):
         return self._available
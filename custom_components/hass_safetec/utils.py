@@ -1,46 +1,97 @@
 import logging
 import asyncio
-from aiohttp import ClientConnectorError
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+import random
+from aiohttp import ClientError, ClientTimeout
+from homeassistant.helpers.aiohttp_client import (
+    async_create_clientsession,
+    async_get_clientsession,
+)
+from homeassistant.util.json import json_loads
 
 LOGGER = logging.getLogger(__name__)
 
+REQUEST_TIMEOUT = ClientTimeout(total=5, connect=3)
+MAX_RETRY_DELAY = 60
+
+# The embedded web server closes idle connections unless asked to keep them open
+KEEPALIVE_HEADERS = {"Connection": "keep-alive"}
+
+
+def is_set_url(url):
+    """Return True for command URLs (e.g. admin mode) rather than reads."""
+    return "/set/" in url
+
+
+async def _fetch_url(session, url):
+    """Fetch a single URL and return the decoded JSON payload, or None on failure."""
+    try:
+        # Use async with only on the request, not the session
+        async with session.get(url, timeout=REQUEST_TIMEOUT, headers=KEEPALIVE_HEADERS) as response:
+            if response.status == 200:
+                # Decode the raw body directly, ignoring a missing Content-Type header.
+                # json_loads is Home Assistant's orjson-backed decoder and accepts bytes.
+                return json_loads(await response.read())
+            LOGGER.error(f"HTTP response error (status {response.status}): {url}")
+    except (ClientError, asyncio.TimeoutError) as e:
+        # Any request error only fails this URL, not the other concurrent reads
+        LOGGER.error(f"HTTP request exeption for {url}: {e}")
+    except ValueError as e:
+        LOGGER.error(f"Invalid JSON response from {url}: {e}")
+    return None
+
+
+def create_session(hass):
+    """Create a Home Assistant managed session for polling a single device."""
+    return async_create_clientsession(hass, timeout=REQUEST_TIMEOUT)
+
 
 # Fetching data with error handling and URL logging
-async def fetch_data(hass, ip, url_list, port=5333, max_attempts=1, retry_delay=10):
-    """Fetch data from the Pontos device using the shared aiohttp session (with simple retry logic)."""
+async def fetch_data(
+    hass,
+    ip,
+    url_list,
+    port=5333,
+    max_attempts=1,
+    retry_delay=10,
+    session=None,
+    deadline=None,
+):
+    """Fetch data from the Pontos device using the given or shared aiohttp session (with simple retry logic).
+
+    If deadline (event loop time) is given, no attempt runs past it.
+    """
     if isinstance(url_list, str):
         # Convert to a one-element list
         url_list = [url_list]
 
-    urls = [url.format(ip=ip, port=port) for url in url_list]
+    # Commands such as admin mode must reach the device before the reads that depend on them
+    set_urls = [url.format(ip=ip, port=port) for url in url_list if is_set_url(url)]
+    read_urls = [url.format(ip=ip, port=port) for url in url_list if not is_set_url(url)]
 
-    # Get the shared aiohttp session from Home Assistant
-    session = async_get_clientsession(hass)
+    # Fall back to the shared aiohttp session from Home Assistant
+    if session is None:
+        session = async_get_clientsession(hass)
 
     # Loop over attempts for a simple retry mechanism
     for attempt in range(1, max_attempts + 1):
-        data = {}
-        failed = False
-
-        # Iterate over each URL and fetch data
-        for url in urls:
-            try:
-                # Use async with only on the request, not the session
-                async with session.get(url, timeout=5) as response:
-                    if response.status == 200:
-                        # Allow decoding JSON even if the Content-Type header is missing.
-                        data.update(
-                            await response.json(content_type=None)
-                        )  # Update data with response
-                    else:
-                        LOGGER.error(
-                            f"HTTP response error (status {response.status}): {url}"
-                        )
-                        failed = True
-            except (ClientConnectorError, asyncio.TimeoutError) as e:
-                LOGGER.error(f"HTTP request exeption for {url}: {e}")
-                failed = True
+        # Send the set calls one by one, then all reads concurrently
+        try:
+            async with asyncio.timeout_at(deadline):
+                results = []
+                for url in set_urls:
+                    results.append(await _fetch_url(session, url))
+                    if results[-1] is None:
+                        break
+                else:
+                    results += await asyncio.gather(
+                        *(_fetch_url(session, url) for url in read_urls)
+                    )
+        except TimeoutError:
+            LOGGER.error(f"Attempt {attempt}/{max_attempts} ran past the deadline")
+            failed = True
+            break
+
+        failed = any(result is None for result in results)
 
         # If no failures, break out of the retry loop
         if not failed:
@@ -48,13 +99,32 @@ async def fetch_data(hass, ip, url_list, port=5333, max_attempts=1, retry_delay=
 
         # If there were failures, wait before retrying (unless it's the last attempt)
         if attempt < max_attempts:
+            # Exponential backoff with full jitter, so retries against a recovering device spread out
+            delay = random.uniform(
+                0, min(MAX_RETRY_DELAY, retry_delay * 2 ** (attempt - 1))
+            )
+            if deadline is not None and asyncio.get_running_loop().time() + delay >= deadline:
+                LOGGER.error(
+                    f"Attempt {attempt}/{max_attempts} failed. No time left to retry before the deadline."
+                )
+                break
             LOGGER.warning(
-                f"Attempt {attempt}/{max_attempts} failed. Retrying in {retry_delay * attempt} seconds..."
+                f"Attempt {attempt}/{max_attempts} failed. Retrying in {delay:.1f} seconds..."
             )
-            await asyncio.sleep(retry_delay * attempt)
+            await asyncio.sleep(delay)
         else:
             LOGGER.error(
                 f"Attempt {attempt}/{max_attempts} failed. No response from device."
             )
 
-    return data if not failed else {}
+    if failed:
+        return {}
+
+    if len(results) == 1:
+        # A single bulk response is already the complete data dict
+        return results[0]
+
+    data = {}
+    for result in results:
+        data.update(result)  # Merge responses in request order
+    return data
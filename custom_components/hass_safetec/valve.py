@@ -44,7 +44,7 @@ class PontosValve(ValveEntity):
         self._attr_reports_position = False
         self._attr_device_class = ValveDeviceClass.WATER
         self._state = None
-        self._device_info = device_info
+        self._attr_device_info = {"identifiers": device_info["identifiers"]}
         self._sensor_unique_id = slugify(f"{device_info['serial_number']}_valve_status")
 
     async def async_added_to_hass(self):
@@ -108,18 +108,6 @@ class PontosValve(ValveEntity):
         """Return the features supported by this valve."""
         return ValveEntityFeature.OPEN | ValveEntityFeature.CLOSE
 
-    @property
-    def unique_id(self):
-        """Return the unique ID of the valve."""
-        return self._attr_unique_id
-
-    @property
-    def device_info(self):
-        """Return device info to link this entity with the device."""
-        return {
-            "identifiers": self._device_info["identifiers"],
-        }
-
     async def async_open_valve(self, **kwargs):
         await self._hass.services.async_call(
             DOMAIN, "open_valve", service_data={"entry_id": self._entry.entry_id}
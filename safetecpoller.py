@@ -0,0 +1,204 @@
+import appdaemon.plugins.hass.hassapi as hass
+import os
+import re
+import requests
+import socket
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+BASE_URL = "http://192.168.1.81:5333/trio"
+
+class DeviceAdapter(HTTPAdapter):
+    # Nagle off for the tiny requests and TCP keep-alive so a dropped device is noticed on idle sockets
+    SOCKET_OPTIONS = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self.SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+def value_pattern(key):
+    # The device answers with a tiny {"key":"123"} body, so scan for the one field we need
+    # The whole value must be an integer, so "12.5" or "12 bar" is reported instead of cut to 12
+    return re.compile(rb'"' + key.encode("ascii") + rb'"\s*:\s*"?(-?\d+)"?\s*[,}]')
+
+# (name, set urls sent before the read when due, get url, response value pattern, output file)
+POLLS = [
+    ("BAR", [], f"{BASE_URL}/get/bar", value_pattern("getBAR"), "/homeassistant/appdaemon/output_bar.txt"),
+    ("VOL", [f"{BASE_URL}/set/adm/(2)f"], f"{BASE_URL}/get/vol", value_pattern("getVOL"), "/homeassistant/appdaemon/output.txt"),
+]
+
+# Seconds between polls
+POLL_INTERVAL = 30
+
+# Device answers are a few dozen bytes, never read more than this
+MAX_BODY = 1024
+
+# Seconds a set request (admin mode) is assumed to stay in effect on the device
+SET_TTL = 300
+
+# What the device answers instead of a value once admin mode has lapsed
+ADMIN_ERROR = b"ERROR: ADM"
+
+# With skip_unchanged, still log an unchanged value after this many polls
+HEARTBEAT_EVERY = 20
+
+# Write buffered lines to the output files after this many polls
+FLUSH_EVERY = 10
+
+class SafetecPoller(hass.Hass):
+    # Endpoints this app polls; the safetecbar / safetecvol shims narrow it to one
+    endpoints = POLLS
+
+    def initialize(self):
+        # One keep-alive connection pool to the device for every request
+        self.session = requests.Session()
+        self.session.mount("http://", DeviceAdapter(pool_connections=1, pool_maxsize=4))
+        # URL, method and headers never change, so prepare every request once
+        self.prepared = {}
+        for _, set_urls, get_url, _, _ in self.endpoints:
+            for url in set_urls + [get_url]:
+                self.prepared[url] = self.session.prepare_request(requests.Request("GET", url))
+        # Lets the polls of a tick wait on the device at the same time
+        self.pool = ThreadPoolExecutor(max_workers=len(self.endpoints))
+        # Keep an append-only descriptor open per output file and collect lines until the next flush
+        self.output_fds = {}
+        self.pending_lines = {}
+        for name, _, _, _, output_file in self.endpoints:
+            self.output_fds[name] = os.open(output_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            self.pending_lines[name] = []
+        self.polls = 0
+        # When each set url was last accepted, so it is only re-sent once SET_TTL has passed,
+        # after a failed set, or when a read reports that admin mode lapsed
+        self.set_ttl = self.args.get("set_ttl", SET_TTL)
+        self.set_last = {}
+        # Last ETag and value per read url, so unchanged readings can be answered with 304
+        self.etags = {}
+        self.last_values = {}
+        # Opt-in: only log a reading when it changed or a heartbeat is due
+        self.skip_unchanged = self.args.get("skip_unchanged", False)
+        self.last_logged = {}
+        # Ticks follow monotonic deadlines, so wall clock jumps neither skip nor double a poll
+        self.next_poll = time.monotonic()
+        self.run_in(self.tick, 0)
+
+    def terminate(self):
+        # initialize may have failed partway, so only tear down what it created
+        if getattr(self, "pool", None) is not None:
+            self.pool.shutdown(wait=False)
+        if getattr(self, "session", None) is not None:
+            self.session.close()
+        if getattr(self, "output_fds", None):
+            self.flush_output()
+            for fd in self.output_fds.values():
+                os.close(fd)
+
+    def flush_output(self):
+        # One O_APPEND writev per batch lands atomically at the end of the file without joining the lines first
+        for name, fd in self.output_fds.items():
+            lines = self.pending_lines[name]
+            while lines:
+                written = os.writev(fd, lines)
+                # A short write leaves the rest of the batch for the next writev
+                while lines and written >= len(lines[0]):
+                    written -= len(lines[0])
+                    lines = lines[1:]
+                if written:
+                    lines[0] = lines[0][written:]
+            self.pending_lines[name] = []
+
+    def tick(self, kwargs):
+        self.next_poll += POLL_INTERVAL
+        try:
+            self.make_api_call(kwargs)
+        finally:
+            now = time.monotonic()
+            # After a stall drop the missed slots instead of firing them back to back
+            while self.next_poll <= now:
+                self.next_poll += POLL_INTERVAL
+            self.run_in(self.tick, self.next_poll - now)
+
+    def log_value(self, name, value, timestamp):
+        if self.skip_unchanged:
+            last = self.last_logged.get(name)
+            if last is not None and last[0] == value and self.polls - last[1] < HEARTBEAT_EVERY:
+                return
+            self.last_logged[name] = (value, self.polls)
+        self.pending_lines[name].append(f"{timestamp}: {value}\n".encode("ascii"))
+
+    def fetch(self, url):
+        # Stream the answer and read a bounded body, skipping requests' content handling
+        prepared = self.prepared[url]
+        etag = self.etags.get(url)
+        # A 304 is only useful while there is a cached value to log in its place
+        if etag and url in self.last_values:
+            prepared = prepared.copy()
+            prepared.headers["If-None-Match"] = etag
+        response = self.session.send(prepared, timeout=5, stream=True)
+        try:
+            return response.status_code, response.headers.get("ETag"), response.raw.read(MAX_BODY, decode_content=True)
+        finally:
+            response.close()
+
+    def fetch_after_set(self, set_urls, get_url):
+        # The read only reflects admin mode once the device has accepted the set request
+        accepted = [url for url in set_urls if self.fetch(url)[0] == 200]
+        return accepted, self.fetch(get_url)
+
+    def make_api_call(self, kwargs):
+        # Run the polls of this tick concurrently, each sending its due set urls before its read
+        futures = []
+        started = time.monotonic()
+        for name, set_urls, get_url, pattern, _ in self.endpoints:
+            due_urls = [
+                url for url in set_urls
+                if started - self.set_last.get(url, -self.set_ttl) >= self.set_ttl
+            ]
+            futures.append((name, set_urls, get_url, pattern, self.pool.submit(self.fetch_after_set, due_urls, get_url)))
+
+        now = time.localtime()
+        timestamp = f"{now.tm_year:04d}-{now.tm_mon:02d}-{now.tm_mday:02d} {now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}"
+        for name, set_urls, get_url, pattern, future in futures:
+            # Only the network round-trips can fail in ways we recover from; bugs should surface.
+            # urllib3 errors can come straight out of the bounded raw read.
+            try:
+                accepted, (status_code, etag, body) = future.result()
+            except (requests.RequestException, HTTPError) as e:
+                self.log(f"Network error occurred: {e}")
+                continue
+            for url in accepted:
+                self.set_last[url] = started
+
+            if status_code == 304:
+                if get_url in self.last_values:
+                    self.log_value(name, self.last_values[get_url], timestamp)
+                else:
+                    # Nothing cached to stand in for the reading, read it in full next tick
+                    self.etags.pop(get_url, None)
+                continue
+
+            if status_code != 200:
+                self.log(f"Error with GET{name} request. Status code: {status_code}")
+                continue
+
+            match = pattern.search(body)
+            if match is None:
+                self.log(f"No {name} value in response: {body!r}")
+                if ADMIN_ERROR in body.upper():
+                    # The device dropped admin mode, send it again next tick
+                    for url in set_urls:
+                        self.set_last.pop(url, None)
+                continue
+
+            value = int(match.group(1))
+            self.last_values[get_url] = value
+            self.etags[get_url] = etag
+            self.log_value(name, value, timestamp)
+
+        self.polls += 1
+        if self.polls % FLUSH_EVERY == 0:
+            self.flush_output()